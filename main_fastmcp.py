@@ -4,20 +4,30 @@ Main entry point for HubSpot Extended MCP Server using FastMCP
 """
 
 from src.fastmcp_server import mcp
+from src.logging_config import get_logger
 
+import asyncio
 import sys
 import os
-import traceback
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+logger = get_logger(__name__)
 
 # Debug: Print startup message to stderr
-print(f"Starting hubspot-extended MCP server... Tokens present: {'HUBSPOT_ACCESS_TOKEN' in os.environ}", file=sys.stderr)
-sys.stderr.flush()
+if os.getenv("DEBUG_STARTUP"):
+    print(f"Starting hubspot-extended MCP server... Tokens present: {'HUBSPOT_ACCESS_TOKEN' in os.environ}", file=sys.stderr)
+    sys.stderr.flush()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         mcp.run()
-    except Exception as e:
-        print(f"CRITICAL ERROR: {e}", file=sys.stderr)
-        traceback.print_exc(file=sys.stderr)
-        sys.stderr.flush()
+    except Exception:
+        logger.exception("FastMCP server crashed")
         sys.exit(1)
\ No newline at end of file
@@ -1,11 +1,11 @@
-#!/usr/bin/env python3
 """
 HubSpot Extended MCP Server using FastMCP
 """
 
+import functools
 import os
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, FrozenSet, List, Optional, Dict, Any
 
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
@@ -16,13 +16,43 @@ from .logging_config import configure_logging
 load_dotenv()
 
 # Configure logging
-configure_logging(log_level=os.getenv("LOG_LEVEL", "INFO"))
+configure_logging(log_level=os.getenv("LOG_LEVEL", "INFO"), log_format=os.getenv("LOG_FORMAT"))
 
-# Initialize FastMCP server
-mcp = FastMCP("hubspot-extended")
 
-# Initialize HubSpot client
-hubspot_client = HubSpotClient()
+@functools.lru_cache(maxsize=1)
+def _client() -> HubSpotClient:
+    """Create the HubSpot client on first use so server startup stays cheap."""
+    return HubSpotClient()
+
+
+# Number of sessions currently inside the lifespan
+_active_sessions = 0
+
+
+# Meeting activity types configured in the HubSpot portal
+_VALID_MEETING_TYPES: FrozenSet[str] = frozenset({"Workshop"})  # Add more as configured in your HubSpot portal
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the pooled HubSpot HTTP client when the last session ends."""
+    # SSE/HTTP transports enter the lifespan once per session, so the shared
+    # client is only closed once no other session is still using it
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if not _active_sessions and _client.cache_info().currsize:
+            client = _client()
+            # Drop the cached client first so a later session creates a fresh one
+            _client.cache_clear()
+            await client.aclose()
+
+
+# Initialize FastMCP server
+mcp = FastMCP("hubspot-extended", lifespan=lifespan)
 
 
 @mcp.tool()
@@ -40,7 +70,7 @@ async def get_meeting_details(
     Returns:
         Complete meeting object with properties, creation date, and associations
     """
-    return await hubspot_client.get_meeting_details(meeting_id, properties)
+    return await _client().get_meeting_details(meeting_id, properties)
 
 
 @mcp.tool()
@@ -78,12 +108,11 @@ async def create_meeting(
         Created meeting object with ID and all properties
     """
     # Validate meeting_type - fall back to Workshop if invalid
-    valid_meeting_types = ["Workshop"]  # Add more as configured in your HubSpot portal
-    if meeting_type and meeting_type not in valid_meeting_types:
+    if meeting_type and meeting_type not in _VALID_MEETING_TYPES:
         # Log warning but don't fail - use default
         meeting_type = "Workshop"
         
-    return await hubspot_client.create_meeting(
+    return await _client().create_meeting(
         title=title,
         start_time=start_time,
         end_time=end_time,
@@ -114,7 +143,7 @@ async def get_deal_notes(
     Returns:
         Notes collection with note content, timestamps, and authors sorted by timestamp
     """
-    return await hubspot_client.get_deal_notes(deal_id, limit, sort_direction)
+    return await _client().get_deal_notes(deal_id, limit, sort_direction)
 
 
 @mcp.tool()
@@ -145,7 +174,7 @@ async def create_note(
         - Note with deal association: content="Call summary", deal_id="12345"
         - Note with multiple associations: content="Discussion notes", contact_id="111", deal_id="222"
     """
-    return await hubspot_client.create_note(
+    return await _client().create_note(
         content=content,
         owner_id=owner_id,
         timestamp=timestamp,
@@ -181,7 +210,7 @@ async def update_note(
 
     Note: At least one optional parameter must be provided.
     """
-    return await hubspot_client.update_note(
+    return await _client().update_note(
         note_id=note_id,
         content=content,
         owner_id=owner_id,
@@ -216,7 +245,7 @@ async def create_task(
     Returns:
         Created task object with ID and all properties
     """
-    return await hubspot_client.create_task(
+    return await _client().create_task(
         title=title,
         assigned_to_user_id=assigned_to_user_id,
         description=description,
@@ -260,7 +289,7 @@ async def get_tasks(
     Returns:
         Tasks collection with titles, descriptions, status, priority, due dates, and associations
     """
-    return await hubspot_client.get_tasks(
+    return await _client().get_tasks(
         owner_id=owner_id,
         contact_id=contact_id,
         deal_id=deal_id,
@@ -286,7 +315,7 @@ async def get_task_details(
     Returns:
         Complete task object with all properties and associations
     """
-    return await hubspot_client.get_task_details(task_id, properties)
+    return await _client().get_task_details(task_id, properties)
 
 
 @mcp.tool()
@@ -311,7 +340,7 @@ async def complete_task(
         - With notes: task_id="123456789", completion_notes="Called client, discussed requirements"
         - With additional updates: task_id="123456789", update_properties={"hs_task_priority": "LOW"}
     """
-    return await hubspot_client.complete_task(task_id, completion_notes, update_properties)
+    return await _client().complete_task(task_id, completion_notes, update_properties)
 
 
 @mcp.tool()
@@ -349,7 +378,7 @@ async def update_task(
 
     Note: At least one optional parameter must be provided. Pass an empty string to clear a field.
     """
-    return await hubspot_client.update_task(
+    return await _client().update_task(
         task_id=task_id,
         title=title,
         description=description,
@@ -390,7 +419,34 @@ async def get_deal_meetings(
         - Get completed meetings excluding Calendly: outcome_filter="COMPLETED", exclude_calendly=true
         - Exclude automated bookings: exclude_calendly=true
     """
-    return await hubspot_client.get_deal_meetings(deal_id, limit, outcome_filter, exclude_calendly, sort_direction)
+    return await _client().get_deal_meetings(deal_id, limit, outcome_filter, exclude_calendly, sort_direction)
+
+
+@mcp.tool()
+async def get_deals_meetings(
+    deal_ids: List[str],
+    limit: int = 100,
+    outcome_filter: Optional[str] = None,
+    exclude_calendly: bool = False,
+    sort_direction: str = "DESCENDING"
+) -> Dict[str, Any]:
+    """
+    Retrieve meetings for several deals in one call, grouped by deal ID.
+    Prefer this over calling get_deal_meetings once per deal (e.g. for pipeline reviews).
+
+    Args:
+        deal_ids: The HubSpot deal IDs to get meetings for
+        limit: Number of meetings to retrieve per deal (default: 100)
+        outcome_filter: Filter by meeting outcome - use "COMPLETED" for completed meetings,
+                       "SCHEDULED" for scheduled meetings, etc. (optional)
+        exclude_calendly: Set to true to filter out automated Calendly/booking system meetings (optional)
+        sort_direction: Sort by meeting start time - "DESCENDING" for most recent first, "ASCENDING" for oldest first (default: "DESCENDING")
+
+    Returns:
+        Object whose "results" maps each deal ID to its list of meetings, plus the total
+        number of meetings returned across all deals.
+    """
+    return await _client().get_deals_meetings(deal_ids, limit, outcome_filter, exclude_calendly, sort_direction)
 
 
 @mcp.tool()
@@ -417,7 +473,7 @@ async def get_overdue_tasks(
           - deals: Array of {id, name} for associated deals
           - contacts: Array of {id, name, email} for associated contacts
     """
-    return await hubspot_client.get_overdue_tasks(owner_id, limit)
+    return await _client().get_overdue_tasks(owner_id, limit)
 
 
 @mcp.tool()
@@ -443,7 +499,7 @@ async def search_meetings(
         - Research feature requests: search_term="API integration"
         - Track product discussions: search_term="automation"
     """
-    return await hubspot_client.search_meetings(search_term, limit, sort_direction)
+    return await _client().search_meetings(search_term, limit, sort_direction)
 
 
 @mcp.tool()
@@ -474,7 +530,7 @@ async def get_tasks_for_deal(
         - Get all tasks (including completed) for a deal: deal_id="38702133148", include_completed=True
         - Get pending tasks with fuzzy matching: deal_name="Delta" (matches "Delta Dental")
     """
-    return await hubspot_client.get_tasks_for_deal(deal_id, deal_name, include_completed, limit)
+    return await _client().get_tasks_for_deal(deal_id, deal_name, include_completed, limit)
 
 
 @mcp.tool()
@@ -508,8 +564,4 @@ async def get_tasks_for_contact(
         - Get all tasks for a contact: contact_id="122794298695", include_completed=True
         - Get pending tasks with partial name: contact_name="John" (fuzzy matches)
     """
-    return await hubspot_client.get_tasks_for_contact(contact_id, contact_name, contact_email, include_completed, limit)
-
-
-if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    return await _client().get_tasks_for_contact(contact_id, contact_name, contact_email, include_completed, limit)
@@ -3,17 +3,259 @@ HubSpot API Client for MCP Server
 """
 
 import asyncio
-import json
+import functools
+import hashlib
+import heapq
+import logging
 import os
+import random
+import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
+from itertools import filterfalse
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
 
 import httpx
+import orjson
 import structlog
-from pydantic import BaseModel
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 
 logger = structlog.get_logger(__name__)
+# Level checks go to the stdlib logger that configure_logging() routes structlog
+# through; the unconfigured structlog proxy has no isEnabledFor
+_std_logger = logging.getLogger(__name__)
+
+# HubSpot caps batch read requests at 100 inputs
+_BATCH_READ_LIMIT = 100
+
+# HubSpot caps search page sizes, and the values of an IN filter, at 100
+_SEARCH_LIMIT = 100
+
+# Largest page the v4 object associations endpoint will return
+_ASSOCIATION_PAGE_LIMIT = 500
+
+_SUPPORTED_METHODS = frozenset({"GET", "POST", "PATCH"})
+
+# Transport errors raised before the request reached HubSpot
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Responses larger than this are decoded and dropped rather than cached
+_CACHE_MAX_BODY_BYTES = 256 * 1024
+
+# Total size of the raw response bodies the cache may hold at once
+_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Bodies larger than this are decoded on a worker thread to keep the loop responsive
+_THREADED_DECODE_BYTES = 64 * 1024
+
+# How long single-object reads wait to be coalesced into one batch read
+_BATCH_WINDOW_SECONDS = 0.005
+
+_MS_PER_DAY = 24 * 60 * 60 * 1000
+
+# Retry backoff starts at 250ms and is capped at 30s
+_RETRY_BASE_DELAY = 0.25
+_RETRY_MAX_DELAY = 30.0
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Case-insensitive single-pass matchers for likely automated bookings
+_CALENDLY_URL_RE = re.compile(re.escape("calendly.com"), re.IGNORECASE)
+_CALENDLY_TITLE_RE = re.compile("|".join(map(re.escape, (
+    "calendly",
+    "quick call",
+    "discovery call",
+    "15 minute",
+    "30 minute",
+    "book a time",
+    "schedule a call"
+))), re.IGNORECASE)
+_CALENDLY_LOCATION_RE = re.compile("|".join(map(re.escape, ("calendly", "automated", "zoom.us/j/"))), re.IGNORECASE)
+
+# Properties requested explicitly so HubSpot only returns fields the tools use
+_TASK_PROPERTIES = (
+    "hs_task_subject",
+    "hs_task_body",
+    "hs_task_status",
+    "hs_task_priority",
+    "hubspot_owner_id",
+    "hs_task_type",
+    "hs_timestamp",
+    "hs_createdate",
+    "hs_task_due_date"
+)
+
+# Static parts of task search requests, shallow-copied per call
+_TASK_SEARCH_TEMPLATE: Dict[str, Any] = {
+    "properties": list(_TASK_PROPERTIES),
+    "sorts": [
+        {
+            "propertyName": "hs_timestamp",
+            "direction": "ASCENDING"
+        }
+    ]
+}
+
+# Tasks in these states are never reported as overdue
+_CLOSED_TASK_STATUSES = frozenset({"COMPLETED", "DEFERRED"})
+
+_OPEN_TASK_STATUS_FILTER: Dict[str, Any] = {
+    "propertyName": "hs_task_status",
+    "operator": "IN",
+    "values": ["NOT_STARTED", "IN_PROGRESS"]
+}
+
+_MEETING_PROPERTIES = (
+    "hs_meeting_title",
+    "hs_meeting_body",
+    "hs_meeting_start_time",
+    "hs_meeting_end_time",
+    "hs_meeting_outcome",
+    "hs_meeting_location",
+    "hs_meeting_external_url",
+    "hs_activity_type",
+    "hs_timestamp",
+    "hs_createdate",
+    "hs_lastmodifieddate",
+    "hubspot_owner_id"
+)
+
+_NOTE_PROPERTIES = (
+    "hs_note_body",
+    "hs_timestamp",
+    "hubspot_owner_id",
+    "hs_createdate",
+    "hs_lastmodifieddate"
+)
+
+_MEETING_SEARCH_PROPERTIES = (
+    "hs_meeting_title",
+    "hs_meeting_body",
+    "hs_meeting_start_time",
+    "hs_meeting_end_time",
+    "hs_meeting_outcome",
+    "hs_meeting_location",
+    "hs_timestamp",
+    "hubspot_owner_id"
+)
+
+_DEAL_SEARCH_PROPERTIES = (
+    "dealname",
+    "dealstage",
+    "amount",
+    "closedate",
+    "pipeline",
+    "hs_lastmodifieddate",
+    "hs_createdate",
+    "hubspot_owner_id"
+)
+
+_CONTACT_SEARCH_PROPERTIES = (
+    "firstname",
+    "lastname",
+    "email",
+    "phone",
+    "company",
+    "hs_lastmodifieddate",
+    "hs_createdate",
+    "hubspot_owner_id"
+)
+
+# Association type payloads for create_meeting, shared across requests since
+# they are only ever serialized, never mutated
+_MEETING_TO_CONTACT_TYPES = [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 200}]
+_MEETING_TO_DEAL_TYPES = [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 212}]
+
+# Comma-joined property params for the single-object context lookups
+_DEAL_INFO_PROPERTIES = "dealname,dealstage,amount,closedate,pipeline,hs_lastmodifieddate"
+_CONTACT_INFO_PROPERTIES = "firstname,lastname,email,phone,company,hs_lastmodifieddate"
+
+# Name lookups return the most recently modified matches first
+_SORT_LASTMODIFIED_DESC: List[Dict[str, str]] = [
+    {
+        "propertyName": "hs_lastmodifieddate",
+        "direction": "DESCENDING"
+    }
+]
+
+
+def _normalize_search_name(name: str) -> str:
+    """Collapse whitespace and case so equivalent name searches share cache entries."""
+    return _WHITESPACE_RE.sub(" ", name).strip().lower()
+
+
+def _meeting_start_time(meeting: Dict[str, Any]) -> str:
+    """Extract start time for sorting, defaulting to "" for null values."""
+    # HubSpot returns fixed-width timestamps (13-digit ms epochs or UTC ISO
+    # strings), so comparing the raw strings orders meetings chronologically
+    return meeting.get("properties", {}).get("hs_meeting_start_time") or ""
+
+
+def _annotate_overdue(tasks: List[Dict[str, Any]], now_ms: int) -> None:
+    """Set is_overdue and overdue_days on each task relative to now_ms."""
+    for task in tasks:
+        task_props = task.get("properties") or {}
+        due_date = task_props.get("hs_task_due_date") or task_props.get("hs_timestamp")
+        task["is_overdue"] = False
+        task["overdue_days"] = 0
+
+        # Due dates are millisecond digit strings; skip anything else without
+        # paying for exception handling
+        if not due_date or not due_date.isdigit() or task_props.get("hs_task_status") in _CLOSED_TASK_STATUSES:
+            continue
+
+        overdue_ms = now_ms - int(due_date)
+        if overdue_ms > 0:
+            task["is_overdue"] = True
+            task["overdue_days"] = overdue_ms // _MS_PER_DAY
+
+
+def _chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of at most size items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _note_timestamp(note: Dict[str, Any]) -> str:
+    """Extract a note's hs_timestamp for sorting, defaulting to "" for null values."""
+    # HubSpot returns fixed-width UTC timestamps, so string order matches time order
+    return note.get("properties", {}).get("hs_timestamp") or ""
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_to_timestamp_ms(iso_date: str) -> int:
+    """Convert an ISO 8601 date string to a milliseconds timestamp."""
+    if iso_date.endswith("Z"):
+        iso_date = iso_date[:-1] + "+00:00"
+    return int(datetime.fromisoformat(iso_date).timestamp() * 1000)
+
+
+async def _decode_json(content: bytes) -> Any:
+    """Decode a JSON body, off the event loop when it is large."""
+    if len(content) > _THREADED_DECODE_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Jittered exponential backoff, honoring Retry-After when HubSpot sends one."""
+    retry_after = 0.0
+    if response is not None:
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except ValueError:
+            # Retry-After may be an HTTP date; fall back to exponential backoff
+            retry_after = 0.0
+
+    if retry_after:
+        # Never retry before the server asked us to, but spread out the herd;
+        # only the added jitter is capped, not the requested wait
+        return retry_after + min(0.25 * retry_after, _RETRY_MAX_DELAY) * random.random()
+
+    base = min(_RETRY_BASE_DELAY * (2 ** attempt), _RETRY_MAX_DELAY)
+    return base * (0.5 + random.random())
 
 
 class HubSpotError(Exception):
@@ -26,25 +268,145 @@ class HubSpotError(Exception):
         super().__init__(message)
 
 
+class BatchFetcher:
+    """Coalesce single-object reads from concurrent coroutines into batch read calls."""
+
+    def __init__(self, client: "HubSpotClient", object_type: str, properties: List[str]):
+        self._client = client
+        self.object_type = object_type
+        self.properties = properties
+        self._pending: Dict[str, List["asyncio.Future[Optional[Dict[str, Any]]]"]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._reads: Set["asyncio.Task[None]"] = set()
+
+    async def get(self, object_id: str) -> Optional[Dict[str, Any]]:
+        """Return the object with the given ID, or None if the batch read omitted it."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Optional[Dict[str, Any]]]" = loop.create_future()
+        self._pending.setdefault(object_id, []).append(future)
+
+        if len(self._pending) >= _BATCH_READ_LIMIT:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(_BATCH_WINDOW_SECONDS, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        if pending:
+            # Keep a reference so the read task is not garbage collected mid-flight
+            read = asyncio.ensure_future(self._read(pending))
+            self._reads.add(read)
+            read.add_done_callback(self._reads.discard)
+
+    async def _read(self, pending: Dict[str, List["asyncio.Future[Optional[Dict[str, Any]]]"]]) -> None:
+        try:
+            results = await self._client._batch_read(self.object_type, list(pending), self.properties)
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        objects_by_id = {obj.get("id"): obj for obj in results}
+        for object_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(objects_by_id.get(object_id))
+
+
 class HubSpotClient:
     """HubSpot API client with authentication and error handling."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None):
         self.access_token = os.getenv("HUBSPOT_ACCESS_TOKEN")
         if not self.access_token:
             raise ValueError("HUBSPOT_ACCESS_TOKEN environment variable is required")
 
         self.base_url = "https://api.hubapi.com"
-        self.headers = {
+        # Read-only defaults; the client sends them with every request, so
+        # _make_request never builds per-call headers
+        self.headers = MappingProxyType({
             "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-
-        # Initialize HTTP client with timeouts and retry logic
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        })
+
+        # Client-wide cap on requests in flight, so parallel fan-out is throttled
+        # locally before HubSpot has to answer with 429s
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("HUBSPOT_MAX_CONCURRENCY", "10"))
+        self._request_sem = asyncio.Semaphore(max_concurrency)
+
+        # Single long-lived HTTP client so every tool call reuses pooled
+        # keep-alive connections instead of paying a TCP/TLS handshake.
+        # The pool is never smaller than the concurrency cap, so a raised
+        # HUBSPOT_MAX_CONCURRENCY is not throttled again by the pool.
         self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers=self.headers
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=max(32, max_concurrency),
+                max_connections=max(64, max_concurrency),
+                keepalive_expiry=60
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+
+        # Leaky bucket matching HubSpot's 100 requests / 10 seconds burst limit,
+        # so concurrent tools wait locally instead of triggering 429 retries
+        self._bucket = AsyncLimiter(100, 10)
+
+        # Short-lived cache of raw response bodies for idempotent reads, plus
+        # the in-flight requests so concurrent identical reads share one call
+        self._cache: TTLCache = TTLCache(
+            maxsize=_CACHE_MAX_BYTES,
+            ttl=float(os.getenv("HUBSPOT_CACHE_TTL", "60")),
+            getsizeof=len
         )
+        # Each in-flight entry is [send task, number of callers awaiting it]
+        self._inflight: Dict[Tuple[str, bytes], List[Any]] = {}
+
+        # Micro-batchers that merge single-object reads from concurrent tools
+        self._deal_fetcher = BatchFetcher(self, "deals", ["dealname"])
+        self._contact_fetcher = BatchFetcher(self, "contacts", ["firstname", "lastname", "email"])
+        self._note_fetcher = BatchFetcher(self, "notes", list(_NOTE_PROPERTIES))
+
+    @staticmethod
+    def _is_cacheable(method: str, endpoint: str) -> bool:
+        """Reads and read-only POSTs (search, batch read) are safe to cache."""
+        if method == "GET":
+            return True
+        return method == "POST" and endpoint.endswith(("/search", "/batch/read"))
+
+    @staticmethod
+    def _cache_key(
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]]
+    ) -> Tuple[str, bytes]:
+        """Key cached responses by endpoint plus a digest of the full request."""
+        request = orjson.dumps([method, endpoint, params, data], option=orjson.OPT_SORT_KEYS)
+        return endpoint, hashlib.blake2b(request, digest_size=16).digest()
+
+    def _invalidate(self, object_type: str) -> None:
+        """Drop cached responses for endpoints touching the given object type."""
+        stale_keys = [key for key in list(self._cache.keys()) if object_type in key[0]]
+        for key in stale_keys:
+            self._cache.pop(key, None)
+
+        # Reads still in flight may predate the write: unlist them so their
+        # responses are not cached and later callers start a fresh send
+        for key in [key for key in self._inflight if object_type in key[0]]:
+            del self._inflight[key]
 
     async def _make_request(
         self,
@@ -52,27 +414,117 @@ class HubSpotClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
-        retries: int = 3
+        retries: int = 3,
+        idempotent: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Make authenticated request to HubSpot API with error handling and retries."""
-        url = f"{self.base_url}{endpoint}"
+        """
+        Make authenticated request to HubSpot API, serving idempotent reads from cache.
+
+        Creates (POSTs other than search and batch read) are treated as
+        non-idempotent unless told otherwise, so ambiguous failures are not
+        retried and cannot produce duplicate objects.
+        """
+        method = method.upper()
+        if not self._is_cacheable(method, endpoint):
+            if idempotent is None:
+                idempotent = method != "POST"
+            content = await self._send_request(method, endpoint, params, data, retries, idempotent)
+            return await _decode_json(content)
+
+        key = self._cache_key(method, endpoint, params, data)
+        content = self._cache.get(key)
+        if content is None:
+            content = await self._send_coalesced(key, method, endpoint, params, data, retries)
+
+        # Decode per call so callers can annotate results without touching the cache
+        return await _decode_json(content)
+
+    async def _send_coalesced(
+        self,
+        key: Tuple[str, bytes],
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        retries: int
+    ) -> bytes:
+        """Send an idempotent request once, sharing the response with identical concurrent callers."""
+        entry = self._inflight.get(key)
+        if entry is None:
+            # The send runs as its own task, so no single caller's cancellation
+            # reaches it while other callers are still waiting on the response
+            send = asyncio.ensure_future(self._send_request(method, endpoint, params, data, retries))
+            entry = self._inflight[key] = [send, 0]
+            send.add_done_callback(functools.partial(self._finish_inflight, key))
+
+        send = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(send)
+        except asyncio.CancelledError:
+            # Abandon the shared request only once its last caller has gone,
+            # and unlist it at once so new callers start a fresh send
+            if entry[1] == 1 and not send.done():
+                send.cancel()
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+            raise
+        finally:
+            entry[1] -= 1
+
+    def _finish_inflight(self, key: Tuple[str, bytes], send: "asyncio.Task[bytes]") -> None:
+        # An entry no longer listed was cancelled or invalidated by a write
+        entry = self._inflight.get(key)
+        current = entry is not None and entry[0] is send
+        if current:
+            del self._inflight[key]
+        # Retrieve the exception so an error without callers is not reported as unhandled
+        if send.cancelled() or send.exception() is not None or not current:
+            return
+
+        # Large search/batch bodies are not kept, so the raw bytes can be freed
+        # as soon as they are decoded instead of living alongside the parsed copy
+        content = send.result()
+        if len(content) <= _CACHE_MAX_BODY_BYTES:
+            self._cache[key] = content
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        retries: int = 3,
+        idempotent: bool = True
+    ) -> bytes:
+        """Send an authenticated request with error handling and retries, returning the raw body."""
+        if method not in _SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Endpoints are relative to the client's base_url
+        url = endpoint
+
+        # Serialize once up front so retries reuse the same body; the
+        # client's default headers already carry the JSON Content-Type
+        body = orjson.dumps(data) if data is not None else None
 
         for attempt in range(retries + 1):
             try:
-                if method.upper() == "GET":
-                    response = await self.client.get(url, params=params)
-                elif method.upper() == "POST":
-                    response = await self.client.post(url, json=data, params=params)
-                elif method.upper() == "PATCH":
-                    response = await self.client.patch(url, json=data, params=params)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                # Held only around the send, so backoff sleeps don't occupy a slot
+                async with self._request_sem:
+                    await self._bucket.acquire()
+                    response = await self.client.request(method, url, params=params, content=body)
+
+                logger.debug("HubSpot response",
+                            endpoint=endpoint,
+                            status_code=response.status_code,
+                            http_version=response.http_version)
 
                 # Handle rate limiting with exponential backoff
                 if response.status_code == 429:
                     if attempt < retries:
-                        wait_time = 2 ** attempt
-                        logger.warning(f"Rate limited, retrying in {wait_time}s", attempt=attempt + 1)
+                        wait_time = _retry_delay(attempt, response)
+                        logger.warning("Rate limited, retrying", wait_seconds=round(wait_time, 2), attempt=attempt + 1)
                         await asyncio.sleep(wait_time)
                         continue
                     else:
@@ -102,9 +554,11 @@ class HubSpotClient:
                         404
                     )
                 elif response.status_code >= 500:
-                    if attempt < retries:
-                        wait_time = 2 ** attempt
-                        logger.warning(f"Server error, retrying in {wait_time}s", attempt=attempt + 1)
+                    # A 503 means the request was turned away; other 5xx may have
+                    # been applied, so only retry those when repeating is safe
+                    if attempt < retries and (idempotent or response.status_code == 503):
+                        wait_time = _retry_delay(attempt, response)
+                        logger.warning("Server error, retrying", wait_seconds=round(wait_time, 2), attempt=attempt + 1)
                         await asyncio.sleep(wait_time)
                         continue
                     else:
@@ -114,20 +568,22 @@ class HubSpotClient:
                             response.status_code
                         )
                 elif not response.is_success:
-                    error_data = response.json() if response.content else {}
+                    error_data = orjson.loads(response.content) if response.content else {}
                     raise HubSpotError(
                         error_data.get("message", f"HTTP {response.status_code}"),
                         "VALIDATION_ERROR",
                         response.status_code
                     )
 
-                # Success - return JSON response
-                return response.json()
+                # Success - return raw JSON body
+                return response.content
 
             except httpx.RequestError as e:
-                if attempt < retries:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Request error, retrying in {wait_time}s", error=str(e), attempt=attempt + 1)
+                # Connection failures happen before anything is sent, so any request
+                # can be retried; after that only idempotent ones may be repeated
+                if attempt < retries and (idempotent or isinstance(e, _UNSENT_REQUEST_ERRORS)):
+                    wait_time = _retry_delay(attempt)
+                    logger.warning("Request error, retrying", wait_seconds=round(wait_time, 2), error=str(e), attempt=attempt + 1)
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -136,11 +592,38 @@ class HubSpotClient:
     def _convert_iso_to_timestamp(self, iso_date: str) -> int:
         """Convert ISO date string to milliseconds timestamp."""
         try:
-            dt = datetime.fromisoformat(iso_date.replace('Z', '+00:00'))
-            return int(dt.timestamp() * 1000)
+            return _iso_to_timestamp_ms(iso_date)
         except ValueError:
             raise HubSpotError(f"Invalid date format: {iso_date}", "VALIDATION_ERROR")
 
+    async def _batch_read(
+        self,
+        object_type: str,
+        object_ids: List[str],
+        properties: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Read objects by ID via the batch API, chunked to HubSpot's input limit and fetched concurrently."""
+        endpoint = f"/crm/v3/objects/{object_type}/batch/read"
+        batch_results = await asyncio.gather(*(
+            self._make_request("POST", endpoint, data={
+                "inputs": [{"id": object_id} for object_id in batch_ids],
+                "properties": properties
+            })
+            for batch_ids in _chunked(object_ids, _BATCH_READ_LIMIT)
+        ))
+
+        results: List[Dict[str, Any]] = []
+        for batch_result in batch_results:
+            results.extend(batch_result.get("results", []))
+
+            # Log any per-object errors from the batch
+            for error in batch_result.get("errors", []):
+                logger.warning("Batch read error",
+                             object_type=object_type,
+                             error=error.get("message"))
+
+        return results
+
     async def get_meeting_details(
         self,
         meeting_id: str,
@@ -149,9 +632,8 @@ class HubSpotClient:
         """Retrieve complete meeting information."""
         logger.info("Getting meeting details", meeting_id=meeting_id)
 
-        params = {}
-        if properties:
-            params["properties"] = ",".join(properties)
+        properties = properties or _MEETING_PROPERTIES
+        params = {"properties": ",".join(properties)}
 
         endpoint = f"/crm/v3/objects/meetings/{meeting_id}"
         result = await self._make_request("GET", endpoint, params=params)
@@ -198,56 +680,15 @@ class HubSpotClient:
                 "deal_id": deal_id
             }
 
-        # Get detailed note information using search API for better sorting
-        if note_ids:
-            search_data = {
-                "filterGroups": [
-                    {
-                        "filters": [
-                            {
-                                "propertyName": "hs_object_id",
-                                "operator": "IN",
-                                "values": note_ids
-                            }
-                        ]
-                    }
-                ],
-                "properties": [
-                    "hs_note_body",
-                    "hs_timestamp",
-                    "hubspot_owner_id",
-                    "hs_createdate",
-                    "hs_lastmodifieddate"
-                ],
-                "sorts": [
-                    {
-                        "propertyName": "hs_timestamp",
-                        "direction": sort_direction
-                    }
-                ],
-                "limit": len(note_ids)
-            }
-
-            try:
-                endpoint = "/crm/v3/objects/notes/search"
-                search_result = await self._make_request("POST", endpoint, data=search_data)
-                notes = search_result.get("results", [])
-            except HubSpotError as e:
-                logger.warning("Failed to use search API for notes, falling back to individual requests", error=str(e))
-                # Fallback to individual requests
-                notes = []
-                properties = "hs_note_body,hs_timestamp,hubspot_owner_id,hs_createdate,hs_lastmodifieddate"
-                for note_id in note_ids:
-                    try:
-                        endpoint = f"/crm/v3/objects/notes/{note_id}"
-                        params = {"properties": properties}
-                        note_details = await self._make_request("GET", endpoint, params=params)
-                        notes.append(note_details)
-                    except HubSpotError as e:
-                        logger.warning("Failed to get note details", note_id=note_id, error=str(e))
-                        continue
-        else:
-            notes = []
+        # Read the known note IDs directly; batch read skips the filter
+        # evaluation a search needs, and sorting a page of notes is cheap
+        try:
+            fetched = await asyncio.gather(*(self._note_fetcher.get(str(note_id)) for note_id in note_ids))
+            notes = [note for note in fetched if note is not None]
+            notes.sort(key=_note_timestamp, reverse=(sort_direction == "DESCENDING"))
+        except HubSpotError as e:
+            logger.warning("Batch read failed for notes, falling back to search API", error=str(e))
+            notes = await self._search_notes_by_id(note_ids, sort_direction)
 
         result = {
             "results": notes,
@@ -259,6 +700,56 @@ class HubSpotClient:
         logger.info("Retrieved deal notes", deal_id=deal_id, count=len(notes))
         return result
 
+    async def _search_notes_by_id(self, note_ids: List[str], sort_direction: str) -> List[Dict[str, Any]]:
+        """Fetch notes through the search API, falling back to individual requests."""
+        search_data = {
+            "filterGroups": [
+                {
+                    "filters": [
+                        {
+                            "propertyName": "hs_object_id",
+                            "operator": "IN",
+                            "values": note_ids
+                        }
+                    ]
+                }
+            ],
+            "properties": list(_NOTE_PROPERTIES),
+            "sorts": [
+                {
+                    "propertyName": "hs_timestamp",
+                    "direction": sort_direction
+                }
+            ],
+            "limit": len(note_ids)
+        }
+
+        try:
+            endpoint = "/crm/v3/objects/notes/search"
+            search_result = await self._make_request("POST", endpoint, data=search_data)
+            return search_result.get("results", [])
+        except HubSpotError as e:
+            logger.warning("Failed to use search API for notes, falling back to individual requests", error=str(e))
+
+        notes = await self._get_notes_individually(note_ids)
+        notes.sort(key=_note_timestamp, reverse=(sort_direction == "DESCENDING"))
+        return notes
+
+    async def _get_notes_individually(self, note_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch notes one request each, concurrently, skipping any that cannot be retrieved."""
+        properties = ",".join(_NOTE_PROPERTIES)
+
+        async def fetch_note(note_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                endpoint = f"/crm/v3/objects/notes/{note_id}"
+                return await self._make_request("GET", endpoint, params={"properties": properties})
+            except HubSpotError as e:
+                logger.warning("Failed to get note details", note_id=note_id, error=str(e))
+                return None
+
+        notes = await asyncio.gather(*(fetch_note(note_id) for note_id in note_ids))
+        return [note for note in notes if note is not None]
+
     async def create_task(
         self,
         title: str,
@@ -316,6 +807,7 @@ class HubSpotClient:
 
         endpoint = "/crm/v3/objects/tasks"
         result = await self._make_request("POST", endpoint, data=data)
+        self._invalidate("task")
 
         logger.info("Created task", task_id=result.get("id"), title=title)
         return result
@@ -395,6 +887,7 @@ class HubSpotClient:
 
         endpoint = "/crm/v3/objects/notes"
         result = await self._make_request("POST", endpoint, data=data)
+        self._invalidate("note")
 
         logger.info("Created note", note_id=result.get("id"))
         return result
@@ -418,135 +911,132 @@ class HubSpotClient:
             limit = 100
 
         # Build request body for search API
-        search_data = {
-            "filterGroups": [],
-            "properties": [
-                "hs_task_subject",
-                "hs_task_body",
-                "hs_task_status",
-                "hs_task_priority",
-                "hubspot_owner_id",
-                "hs_task_type",
-                "hs_timestamp",
-                "hs_createdate",
-                "hs_task_due_date"
-            ],
-            "limit": limit,
-            "sorts": [
-                {
-                    "propertyName": "hs_timestamp",
-                    "direction": "ASCENDING"
-                }
-            ]
-        }
+        search_data = {**_TASK_SEARCH_TEMPLATE, "filterGroups": [], "limit": limit}
+
+        # Build filters for search API
+        filters = []
+        if owner_id:
+            filters.append({
+                "propertyName": "hubspot_owner_id",
+                "operator": "EQ",
+                "value": owner_id
+            })
+        if status:
+            filters.append({
+                "propertyName": "hs_task_status",
+                "operator": "EQ",
+                "value": status
+            })
 
-        # Build filter groups for search API
-        if owner_id or status or due_date_start or due_date_end:
-            filters = []
-            if owner_id:
+        # Add date range filters
+        if due_date_start:
+            try:
+                start_ms = str(self._convert_iso_to_timestamp(due_date_start))
                 filters.append({
-                    "propertyName": "hubspot_owner_id",
-                    "operator": "EQ",
-                    "value": owner_id
+                    "propertyName": "hs_timestamp",
+                    "operator": "GTE",
+                    "value": start_ms
                 })
-            if status:
+            except HubSpotError:
+                logger.warning("Invalid due_date_start format", due_date_start=due_date_start)
+
+        if due_date_end:
+            try:
+                end_ms = str(self._convert_iso_to_timestamp(due_date_end))
                 filters.append({
-                    "propertyName": "hs_task_status",
-                    "operator": "EQ",
-                    "value": status
+                    "propertyName": "hs_timestamp",
+                    "operator": "LTE",
+                    "value": end_ms
                 })
+            except HubSpotError:
+                logger.warning("Invalid due_date_end format", due_date_end=due_date_end)
+
+        # Push association filters into the search so HubSpot does the matching
+        association_filters = []
+        if contact_id:
+            association_filters.append({
+                "propertyName": "associations.contact",
+                "operator": "EQ",
+                "value": contact_id
+            })
+        if deal_id:
+            association_filters.append({
+                "propertyName": "associations.deal",
+                "operator": "EQ",
+                "value": deal_id
+            })
 
-            # Add date range filters
-            if due_date_start:
-                try:
-                    start_ms = str(self._convert_iso_to_timestamp(due_date_start))
-                    filters.append({
-                        "propertyName": "hs_timestamp",
-                        "operator": "GTE",
-                        "value": start_ms
-                    })
-                except HubSpotError:
-                    logger.warning("Invalid due_date_start format", due_date_start=due_date_start)
-
-            if due_date_end:
-                try:
-                    end_ms = str(self._convert_iso_to_timestamp(due_date_end))
-                    filters.append({
-                        "propertyName": "hs_timestamp",
-                        "operator": "LTE",
-                        "value": end_ms
-                    })
-                except HubSpotError:
-                    logger.warning("Invalid due_date_end format", due_date_end=due_date_end)
-
-            if filters:
-                search_data["filterGroups"].append({"filters": filters})
-
-        logger.debug("Search request data", search_data=search_data)
+        if filters or association_filters:
+            search_data["filterGroups"].append({"filters": filters + association_filters})
 
-        endpoint = "/crm/v3/objects/tasks/search"
-        result = await self._make_request("POST", endpoint, data=search_data)
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Search request data", search_data=search_data)
 
-        # Post-filter by associations if needed
-        if contact_id or deal_id:
-            filtered_results = []
-            if "results" in result:
-                for task in result["results"]:
-                    task_id = task["id"]
-                    # Get task associations
-                    assoc_endpoint = f"/crm/v3/objects/tasks/{task_id}/associations/contacts,deals"
-                    try:
-                        associations = await self._make_request("GET", assoc_endpoint)
-
-                        match = True
-                        if contact_id and not any(
-                            assoc["id"] == contact_id
-                            for assoc in associations.get("associations", {}).get("contacts", {}).get("results", [])
-                        ):
-                            match = False
-
-                        if deal_id and not any(
-                            assoc["id"] == deal_id
-                            for assoc in associations.get("associations", {}).get("deals", {}).get("results", [])
-                        ):
-                            match = False
-
-                        if match:
-                            filtered_results.append(task)
-                    except HubSpotError:
-                        # Skip tasks we can't get associations for
-                        continue
+        endpoint = "/crm/v3/objects/tasks/search"
+        try:
+            result = await self._make_request("POST", endpoint, data=search_data)
+        except HubSpotError as e:
+            if not association_filters or e.status_code != 400:
+                raise
 
-            result["results"] = filtered_results
-            result["total"] = len(filtered_results)
+            # Fall back to filtering by associations client-side
+            logger.warning("Search API rejected association filters, filtering tasks client-side", error=str(e))
+            search_data["filterGroups"] = [{"filters": filters}] if filters else []
+            result = await self._make_request("POST", endpoint, data=search_data)
+            result["results"] = await self._filter_tasks_by_association(
+                result.get("results", []), contact_id, deal_id
+            )
+            result["total"] = len(result["results"])
 
         # Add overdue status to tasks
         if "results" in result:
-            current_time = datetime.now().timestamp() * 1000  # Current time in milliseconds
-            for task in result["results"]:
-                task_props = task.get("properties", {})
-
-                # Check if task has a due date and is overdue
-                due_date = task_props.get("hs_task_due_date") or task_props.get("hs_timestamp")
-                task["is_overdue"] = False
-                task["overdue_days"] = 0
-
-                if due_date and task_props.get("hs_task_status") not in ["COMPLETED", "DEFERRED"]:
-                    try:
-                        due_date_ms = int(due_date)
-                        if current_time > due_date_ms:
-                            task["is_overdue"] = True
-                            # Calculate days overdue
-                            overdue_ms = current_time - due_date_ms
-                            task["overdue_days"] = int(overdue_ms / (24 * 60 * 60 * 1000))
-                    except (ValueError, TypeError):
-                        # Invalid date format, skip overdue calculation
-                        pass
+            _annotate_overdue(result["results"], int(time.time() * 1000))
 
         logger.info("Retrieved tasks", count=len(result.get("results", [])),
                    overdue_count=len([t for t in result.get("results", []) if t.get("is_overdue", False)]))
         return result
 
+    async def _filter_tasks_by_association(
+        self,
+        tasks: List[Dict[str, Any]],
+        contact_id: Optional[str] = None,
+        deal_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Keep only tasks associated with the given contact and/or deal."""
+        async def fetch_associations(task_id: str) -> Dict[str, Any]:
+            endpoint = f"/crm/v3/objects/tasks/{task_id}/associations/contacts,deals"
+            return await self._make_request("GET", endpoint)
+
+        associations_list = await asyncio.gather(
+            *(fetch_associations(task["id"]) for task in tasks),
+            return_exceptions=True
+        )
+
+        filtered_results = []
+        for task, associations in zip(tasks, associations_list):
+            if isinstance(associations, HubSpotError):
+                # Skip tasks we can't get associations for
+                continue
+            if isinstance(associations, BaseException):
+                raise associations
+
+            task_associations = associations.get("associations", {})
+
+            # Deal is usually the more selective filter, so check it first
+            if deal_id:
+                deal_ids = {assoc["id"] for assoc in task_associations.get("deals", {}).get("results", [])}
+                if deal_id not in deal_ids:
+                    continue
+
+            if contact_id:
+                contact_ids = {assoc["id"] for assoc in task_associations.get("contacts", {}).get("results", [])}
+                if contact_id not in contact_ids:
+                    continue
+
+            filtered_results.append(task)
+
+        return filtered_results
+
     async def _enrich_tasks_with_associations(
         self,
         tasks: List[Dict[str, Any]]
@@ -554,83 +1044,41 @@ class HubSpotClient:
         """
         Enrich tasks with associated deal and contact details.
 
-        For each task, fetches associations and then batch-fetches deal names
-        and contact names to provide full context.
+        Batch-fetches associations for all tasks and then batch-fetches deal
+        names and contact names to provide full context.
         """
         if not tasks:
             return tasks
 
-        # Collect associations for each task
+        # Batch fetch deal and contact associations for all tasks concurrently
+        task_ids = [task["id"] for task in tasks if task.get("id")]
+        deal_associations, contact_associations = await asyncio.gather(
+            self._get_association_ids("task", task_ids, "deal"),
+            self._get_association_ids("task", task_ids, "contact"),
+            return_exceptions=True
+        )
+        if isinstance(deal_associations, BaseException):
+            logger.warning("Failed to batch fetch deal associations for tasks", error=str(deal_associations))
+            deal_associations = {}
+        if isinstance(contact_associations, BaseException):
+            logger.warning("Failed to batch fetch contact associations for tasks", error=str(contact_associations))
+            contact_associations = {}
+
         task_associations: Dict[str, Dict[str, List[str]]] = {}
         all_deal_ids: set = set()
         all_contact_ids: set = set()
-
-        for task in tasks:
-            task_id = task.get("id")
-            if not task_id:
-                continue
-
-            task_associations[task_id] = {"deal_ids": [], "contact_ids": []}
-
-            # Fetch deal associations for this task
-            try:
-                deal_assoc_endpoint = f"/crm/v4/objects/task/{task_id}/associations/deal"
-                deal_assoc_result = await self._make_request("GET", deal_assoc_endpoint)
-                # Convert to strings for consistent lookup (batch read returns string IDs)
-                deal_ids = [str(assoc["toObjectId"]) for assoc in deal_assoc_result.get("results", [])]
-                task_associations[task_id]["deal_ids"] = deal_ids
-                all_deal_ids.update(deal_ids)
-            except HubSpotError as e:
-                logger.warning("Failed to fetch deal associations for task", task_id=task_id, error=str(e))
-
-            # Fetch contact associations for this task
-            try:
-                contact_assoc_endpoint = f"/crm/v4/objects/task/{task_id}/associations/contact"
-                contact_assoc_result = await self._make_request("GET", contact_assoc_endpoint)
-                # Convert to strings for consistent lookup (batch read returns string IDs)
-                contact_ids = [str(assoc["toObjectId"]) for assoc in contact_assoc_result.get("results", [])]
-                task_associations[task_id]["contact_ids"] = contact_ids
-                all_contact_ids.update(contact_ids)
-            except HubSpotError as e:
-                logger.warning("Failed to fetch contact associations for task", task_id=task_id, error=str(e))
-
-        # Batch fetch deal details
-        deal_details: Dict[str, Dict[str, Any]] = {}
-        if all_deal_ids:
-            try:
-                batch_data = {
-                    "inputs": [{"id": deal_id} for deal_id in all_deal_ids],
-                    "properties": ["dealname"]
-                }
-                endpoint = "/crm/v3/objects/deals/batch/read"
-                batch_result = await self._make_request("POST", endpoint, data=batch_data)
-                for deal in batch_result.get("results", []):
-                    deal_id = deal.get("id")
-                    deal_name = deal.get("properties", {}).get("dealname", "")
-                    deal_details[deal_id] = {"id": deal_id, "name": deal_name}
-            except HubSpotError as e:
-                logger.warning("Failed to batch fetch deal details", error=str(e))
-
-        # Batch fetch contact details
-        contact_details: Dict[str, Dict[str, Any]] = {}
-        if all_contact_ids:
-            try:
-                batch_data = {
-                    "inputs": [{"id": contact_id} for contact_id in all_contact_ids],
-                    "properties": ["firstname", "lastname", "email"]
-                }
-                endpoint = "/crm/v3/objects/contacts/batch/read"
-                batch_result = await self._make_request("POST", endpoint, data=batch_data)
-                for contact in batch_result.get("results", []):
-                    contact_id = contact.get("id")
-                    props = contact.get("properties", {})
-                    firstname = props.get("firstname", "") or ""
-                    lastname = props.get("lastname", "") or ""
-                    name = f"{firstname} {lastname}".strip()
-                    email = props.get("email", "")
-                    contact_details[contact_id] = {"id": contact_id, "name": name, "email": email}
-            except HubSpotError as e:
-                logger.warning("Failed to batch fetch contact details", error=str(e))
+        for task_id in task_ids:
+            deal_ids = deal_associations.get(task_id, [])
+            contact_ids = contact_associations.get(task_id, [])
+            task_associations[task_id] = {"deal_ids": deal_ids, "contact_ids": contact_ids}
+            all_deal_ids.update(deal_ids)
+            all_contact_ids.update(contact_ids)
+
+        # Batch fetch deal and contact details concurrently
+        deal_details, contact_details = await asyncio.gather(
+            self._get_deal_summaries(all_deal_ids),
+            self._get_contact_summaries(all_contact_ids)
+        )
 
         # Attach enriched associations to each task
         for task in tasks:
@@ -650,6 +1098,86 @@ class HubSpotClient:
                    contacts_fetched=len(contact_details))
         return tasks
 
+    async def _get_association_ids(
+        self,
+        from_object_type: str,
+        object_ids: List[str],
+        to_object_type: str
+    ) -> Dict[str, List[str]]:
+        """Batch fetch the IDs of objects of to_object_type associated with each given object."""
+        endpoint = f"/crm/v4/associations/{from_object_type}/{to_object_type}/batch/read"
+        batch_results = await asyncio.gather(*(
+            self._make_request("POST", endpoint, data={"inputs": [{"id": object_id} for object_id in batch_ids]})
+            for batch_ids in _chunked(object_ids, _BATCH_READ_LIMIT)
+        ))
+
+        associations: Dict[str, List[str]] = {}
+        paged_ids: List[str] = []
+        for result in batch_results:
+            # Convert to strings for consistent lookup (batch read returns string IDs)
+            for item in result.get("results", []):
+                object_id = str(item["from"]["id"])
+                associations[object_id] = [str(assoc["toObjectId"]) for assoc in item.get("to", [])]
+                if item.get("paging", {}).get("next", {}).get("after"):
+                    paged_ids.append(object_id)
+
+        # The batch read only returns the first page per object, and a later page
+        # can hold the most recent meetings, so re-read those objects in full
+        async def read_all(object_id: str) -> List[str]:
+            return [
+                str(assoc["toObjectId"])
+                async for page in self._iter_associations(from_object_type, object_id, to_object_type)
+                for assoc in page
+            ]
+
+        if paged_ids:
+            all_pages = await asyncio.gather(*(read_all(object_id) for object_id in paged_ids))
+            associations.update(zip(paged_ids, all_pages))
+
+        return associations
+
+    async def _get_deal_summaries(self, deal_ids: set) -> Dict[str, Dict[str, Any]]:
+        """Fetch deal names keyed by deal ID through the shared deal batcher."""
+        deal_details: Dict[str, Dict[str, Any]] = {}
+        if not deal_ids:
+            return deal_details
+
+        try:
+            deals = await asyncio.gather(*(self._deal_fetcher.get(deal_id) for deal_id in deal_ids))
+            for deal in deals:
+                if deal is None:
+                    continue
+                deal_id = deal.get("id")
+                deal_name = deal.get("properties", {}).get("dealname", "")
+                deal_details[deal_id] = {"id": deal_id, "name": deal_name}
+        except HubSpotError as e:
+            logger.warning("Failed to batch fetch deal details", error=str(e))
+
+        return deal_details
+
+    async def _get_contact_summaries(self, contact_ids: set) -> Dict[str, Dict[str, Any]]:
+        """Fetch contact names and emails keyed by contact ID through the shared contact batcher."""
+        contact_details: Dict[str, Dict[str, Any]] = {}
+        if not contact_ids:
+            return contact_details
+
+        try:
+            contacts = await asyncio.gather(*(self._contact_fetcher.get(contact_id) for contact_id in contact_ids))
+            for contact in contacts:
+                if contact is None:
+                    continue
+                contact_id = contact.get("id")
+                props = contact.get("properties", {})
+                firstname = props.get("firstname", "") or ""
+                lastname = props.get("lastname", "") or ""
+                name = f"{firstname} {lastname}".strip()
+                email = props.get("email", "")
+                contact_details[contact_id] = {"id": contact_id, "name": name, "email": email}
+        except HubSpotError as e:
+            logger.warning("Failed to batch fetch contact details", error=str(e))
+
+        return contact_details
+
     async def get_overdue_tasks(
         self,
         owner_id: Optional[str] = None,
@@ -664,18 +1192,15 @@ class HubSpotClient:
             limit = 100
 
         # Get current time in milliseconds
-        current_time_ms = int(datetime.now().timestamp() * 1000)
+        current_time_ms = int(time.time() * 1000)
 
         # Build search data with filters for overdue tasks
         search_data = {
+            **_TASK_SEARCH_TEMPLATE,
             "filterGroups": [
                 {
                     "filters": [
-                        {
-                            "propertyName": "hs_task_status",
-                            "operator": "IN",
-                            "values": ["NOT_STARTED", "IN_PROGRESS"]
-                        },
+                        _OPEN_TASK_STATUS_FILTER,
                         {
                             "propertyName": "hs_timestamp",
                             "operator": "LT",
@@ -684,24 +1209,7 @@ class HubSpotClient:
                     ]
                 }
             ],
-            "properties": [
-                "hs_task_subject",
-                "hs_task_body",
-                "hs_task_status",
-                "hs_task_priority",
-                "hubspot_owner_id",
-                "hs_task_type",
-                "hs_timestamp",
-                "hs_createdate",
-                "hs_task_due_date"
-            ],
-            "limit": limit,
-            "sorts": [
-                {
-                    "propertyName": "hs_timestamp",
-                    "direction": "ASCENDING"
-                }
-            ]
+            "limit": limit
         }
 
         # Add owner filter if specified
@@ -712,7 +1220,8 @@ class HubSpotClient:
                 "value": owner_id
             })
 
-        logger.debug("Overdue tasks search request", search_data=search_data)
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Overdue tasks search request", search_data=search_data)
 
         endpoint = "/crm/v3/objects/tasks/search"
         result = await self._make_request("POST", endpoint, data=search_data)
@@ -720,16 +1229,14 @@ class HubSpotClient:
         # Add overdue calculations to results
         if "results" in result:
             for task in result["results"]:
-                task_props = task.get("properties", {})
+                task_props = task.get("properties") or {}
                 due_date = task_props.get("hs_task_due_date") or task_props.get("hs_timestamp")
                 task["is_overdue"] = True  # All results should be overdue by definition
                 task["overdue_days"] = 0
 
                 if due_date:
                     try:
-                        due_date_ms = int(due_date)
-                        overdue_ms = current_time_ms - due_date_ms
-                        task["overdue_days"] = int(overdue_ms / (24 * 60 * 60 * 1000))
+                        task["overdue_days"] = (current_time_ms - int(due_date)) // _MS_PER_DAY
                     except (ValueError, TypeError):
                         pass
 
@@ -748,9 +1255,8 @@ class HubSpotClient:
         """Retrieve detailed information for a specific task."""
         logger.info("Getting task details", task_id=task_id)
 
-        params = {}
-        if properties:
-            params["properties"] = ",".join(properties)
+        properties = properties or _TASK_PROPERTIES
+        params = {"properties": ",".join(properties)}
 
         endpoint = f"/crm/v3/objects/tasks/{task_id}"
         result = await self._make_request("GET", endpoint, params=params)
@@ -796,6 +1302,7 @@ class HubSpotClient:
 
         endpoint = f"/crm/v3/objects/tasks/{task_id}"
         result = await self._make_request("PATCH", endpoint, data=data)
+        self._invalidate("task")
 
         logger.info("Completed task", task_id=task_id, status=result.get("properties", {}).get("hs_task_status"))
         return result
@@ -862,6 +1369,7 @@ class HubSpotClient:
 
         endpoint = f"/crm/v3/objects/tasks/{task_id}"
         result = await self._make_request("PATCH", endpoint, data=data)
+        self._invalidate("task")
 
         logger.info("Updated task", task_id=task_id, updated_properties=list(properties.keys()))
         return result
@@ -911,10 +1419,30 @@ class HubSpotClient:
 
         endpoint = f"/crm/v3/objects/notes/{note_id}"
         result = await self._make_request("PATCH", endpoint, data=data)
+        self._invalidate("note")
 
         logger.info("Updated note", note_id=note_id, updated_properties=list(properties.keys()))
         return result
 
+    async def _iter_associations(
+        self,
+        from_object_type: str,
+        object_id: str,
+        to_object_type: str
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of v4 associations for an object, following paging cursors."""
+        endpoint = f"/crm/v4/objects/{from_object_type}/{object_id}/associations/{to_object_type}"
+        params: Dict[str, Any] = {"limit": _ASSOCIATION_PAGE_LIMIT}
+
+        while True:
+            page = await self._make_request("GET", endpoint, params=params)
+            yield page.get("results", [])
+
+            after = page.get("paging", {}).get("next", {}).get("after")
+            if not after:
+                return
+            params = {"limit": _ASSOCIATION_PAGE_LIMIT, "after": after}
+
     async def get_deal_meetings(
         self,
         deal_id: str,
@@ -939,16 +1467,16 @@ class HubSpotClient:
 
         logger.info("Getting deal meetings", deal_id=deal_id, limit=limit, outcome_filter=outcome_filter, exclude_calendly=exclude_calendly, sort_direction=sort_direction)
 
-        # Get ALL meeting associations for the deal first (we'll filter/limit after sorting)
-        # Use a high limit to get all meetings, then we can filter and sort properly
-        params = {"limit": 500}  # Get all meetings first, then filter/sort
-        endpoint = f"/crm/v4/objects/deal/{deal_id}/associations/meeting"
-        associations_result = await self._make_request("GET", endpoint, params=params)
+        # Get ALL meeting associations for the deal first (we'll filter/limit after sorting);
+        # association pages are not ordered by start time, so every page is needed
+        association_results: List[Dict[str, Any]] = []
+        async for page in self._iter_associations("deal", deal_id, "meeting"):
+            association_results.extend(page)
+        associations_result = {"results": association_results}
 
-        # Extract meeting IDs from associations
-        meeting_ids = []
-        if "results" in associations_result:
-            meeting_ids = [assoc["toObjectId"] for assoc in associations_result["results"]]
+        # Extract meeting IDs from associations; v4 can repeat an ID once per
+        # association label, so dedupe (preserving order) before searching
+        meeting_ids = list(dict.fromkeys(assoc["toObjectId"] for assoc in association_results))
 
         # If no meetings found, return empty result
         if not meeting_ids:
@@ -961,7 +1489,7 @@ class HubSpotClient:
 
         # Always use filtered meetings path to ensure proper sorting
         # (The search API allows us to sort, while batch API does not)
-        meetings = await self._get_filtered_meetings(meeting_ids, outcome_filter, exclude_calendly, sort_direction)
+        meetings = await self._get_filtered_meetings(meeting_ids, outcome_filter, exclude_calendly, sort_direction, limit)
 
         # Apply the limit AFTER filtering and sorting to get the top N results
         limited_meetings = meetings[:limit] if limit else meetings
@@ -976,172 +1504,201 @@ class HubSpotClient:
         logger.info("Retrieved deal meetings", deal_id=deal_id, count=len(meetings))
         return result
 
+    async def get_deals_meetings(
+        self,
+        deal_ids: List[str],
+        limit: int = 100,
+        outcome_filter: Optional[str] = None,
+        exclude_calendly: bool = False,
+        sort_direction: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve meetings for several deals at once, grouped by deal.
+
+        Uses one batch associations read and one meetings search per 100
+        meetings for all deals, instead of two requests per deal.
+
+        Args:
+            deal_ids: The HubSpot deal IDs
+            limit: Number of meetings to retrieve per deal (default: 100)
+            outcome_filter: Filter by meeting outcome (e.g., "COMPLETED", "SCHEDULED", "NO_SHOW", "CANCELED")
+            exclude_calendly: If True, attempts to filter out automated Calendly meetings
+            sort_direction: Sort direction for meeting start time - "DESCENDING" or "ASCENDING" (default: "DESCENDING")
+        """
+        if not sort_direction:
+            sort_direction = "DESCENDING"
+
+        logger.info("Getting meetings for deals", deal_count=len(deal_ids), limit=limit, outcome_filter=outcome_filter, exclude_calendly=exclude_calendly, sort_direction=sort_direction)
+
+        deal_ids = list(dict.fromkeys(str(deal_id) for deal_id in deal_ids))
+        associations = await self._get_association_ids("deal", deal_ids, "meeting")
+
+        # Reverse map so each meeting can be attributed to every deal it belongs to
+        meeting_deals: Dict[str, List[str]] = {}
+        for deal_id, meeting_ids in associations.items():
+            for meeting_id in meeting_ids:
+                meeting_deals.setdefault(meeting_id, []).append(deal_id)
+
+        results: Dict[str, List[Dict[str, Any]]] = {deal_id: [] for deal_id in deal_ids}
+        if meeting_deals:
+            meetings = await self._get_filtered_meetings(list(meeting_deals), outcome_filter, exclude_calendly, sort_direction)
+
+            # Meetings arrive sorted, so appending in order keeps each deal's list sorted
+            for meeting in meetings:
+                for deal_id in meeting_deals.get(str(meeting.get("id")), []):
+                    deal_meetings = results[deal_id]
+                    if not limit or len(deal_meetings) < limit:
+                        deal_meetings.append(meeting)
+
+        total = sum(len(deal_meetings) for deal_meetings in results.values())
+        logger.info("Retrieved meetings for deals", deal_count=len(deal_ids), count=total)
+        return {
+            "results": results,
+            "total": total,
+            "deal_ids": deal_ids
+        }
+
     async def _get_filtered_meetings(
         self,
         meeting_ids: List[str],
         outcome_filter: Optional[str] = None,
         exclude_calendly: bool = False,
-        sort_direction: str = "DESCENDING"
+        sort_direction: str = "DESCENDING",
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Filter meetings using the search API for better performance."""
         if not meeting_ids:
             return []
 
-        # Build search filters
-        filters = [
-            {
-                "propertyName": "hs_object_id",
-                "operator": "IN",
-                "values": meeting_ids
-            }
-        ]
-
-        # Add outcome filter
-        if outcome_filter:
-            filters.append({
-                "propertyName": "hs_meeting_outcome",
-                "operator": "EQ",
-                "value": outcome_filter
-            })
+        # HubSpot sorts and filters server-side, so only the top `limit` rows are
+        # needed unless the Calendly filter still has to drop some client-side
+        top_only = bool(limit) and not exclude_calendly
 
-        # Build search request
-        search_data = {
-            "filterGroups": [{"filters": filters}],
-            "properties": [
-                "hs_meeting_title",
-                "hs_meeting_body",
-                "hs_meeting_start_time",
-                "hs_meeting_end_time",
-                "hs_meeting_outcome",
-                "hs_meeting_location",
-                "hs_meeting_external_url",
-                "hs_activity_type",
-                "hs_timestamp",
-                "hs_createdate",
-                "hs_lastmodifieddate",
-                "hubspot_owner_id"
-            ],
-            "limit": len(meeting_ids),
-            "sorts": [
+        def build_search(chunk_ids: List[str]) -> Dict[str, Any]:
+            filters = [
                 {
-                    "propertyName": "hs_meeting_start_time",
-                    "direction": sort_direction
+                    "propertyName": "hs_object_id",
+                    "operator": "IN",
+                    "values": chunk_ids
                 }
             ]
-        }
+
+            # Add outcome filter
+            if outcome_filter:
+                filters.append({
+                    "propertyName": "hs_meeting_outcome",
+                    "operator": "EQ",
+                    "value": outcome_filter
+                })
+
+            return {
+                "filterGroups": [{"filters": filters}],
+                "properties": list(_MEETING_PROPERTIES),
+                "limit": min(limit, len(chunk_ids)) if top_only else len(chunk_ids),
+                "sorts": [
+                    {
+                        "propertyName": "hs_meeting_start_time",
+                        "direction": sort_direction
+                    }
+                ]
+            }
 
         try:
             endpoint = "/crm/v3/objects/meetings/search"
+            chunks = list(_chunked(meeting_ids, _SEARCH_LIMIT))
             logger.debug("Search API request",
                         endpoint=endpoint,
-                        filter_count=len(filters),
+                        search_count=len(chunks),
                         has_outcome_filter=bool(outcome_filter),
                         meeting_ids_count=len(meeting_ids))
-            search_result = await self._make_request("POST", endpoint, data=search_data)
-            meetings = search_result.get("results", [])
+
+            # Search at most 100 IDs at a time, concurrently, then merge the
+            # already sorted pages instead of re-sorting everything
+            search_results = await asyncio.gather(*(
+                self._make_request("POST", endpoint, data=build_search(chunk_ids)) for chunk_ids in chunks
+            ))
+            pages = [search_result.get("results", []) for search_result in search_results]
+            if len(pages) == 1:
+                meetings = pages[0]
+            else:
+                meetings = list(heapq.merge(*pages, key=_meeting_start_time, reverse=(sort_direction == "DESCENDING")))
+                if top_only:
+                    meetings = meetings[:limit]
             logger.debug("Search API response",
                         returned_count=len(meetings),
                         total_meeting_ids=len(meeting_ids))
 
-            # Additional filtering for Calendly meetings if requested
+            # Additional filtering for Calendly meetings if requested; filtering
+            # keeps the order the search API already sorted by start time
             if exclude_calendly:
                 meetings = self._filter_calendly_meetings(meetings)
 
-            # Client-side sort as fallback to ensure correct ordering
-            meetings = self._sort_meetings_by_start_time(meetings, sort_direction)
-
             return meetings
 
         except HubSpotError as e:
-            logger.warning("Failed to use search API for meeting filtering, falling back to individual requests", error=str(e))
+            logger.warning("Failed to use search API for meeting filtering, falling back to batch read", error=str(e))
 
-            # Fallback to individual meeting requests
+            # Fallback to batch reads, then apply filters manually
             meetings = []
-            for meeting_id in meeting_ids:
-                try:
-                    meeting_details = await self.get_meeting_details(meeting_id)
-
-                    # Apply filters manually
-                    if outcome_filter:
-                        meeting_outcome = meeting_details.get("properties", {}).get("hs_meeting_outcome")
-                        if meeting_outcome != outcome_filter:
-                            continue
-
-                    if exclude_calendly and self._is_calendly_meeting(meeting_details):
+            for meeting_details in await self._get_meetings_batch(meeting_ids):
+                if outcome_filter:
+                    meeting_outcome = meeting_details.get("properties", {}).get("hs_meeting_outcome")
+                    if meeting_outcome != outcome_filter:
                         continue
 
-                    meetings.append(meeting_details)
-
-                except HubSpotError:
+                if exclude_calendly and self._is_calendly_meeting(meeting_details):
                     continue
 
+                meetings.append(meeting_details)
+
             # Client-side sort for fallback path
-            meetings = self._sort_meetings_by_start_time(meetings, sort_direction)
+            meetings = self._sort_meetings_by_start_time(meetings, sort_direction, limit)
 
             return meetings
 
     def _filter_calendly_meetings(self, meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter out likely Calendly/automated meetings based on various indicators."""
-        filtered_meetings = []
+        filtered_meetings = list(filterfalse(self._is_calendly_meeting, meetings))
 
-        for meeting in meetings:
-            if self._is_calendly_meeting(meeting):
-                logger.debug("Filtering out potential Calendly meeting", meeting_id=meeting.get("id"))
-                continue
-            filtered_meetings.append(meeting)
+        if _std_logger.isEnabledFor(logging.DEBUG) and len(filtered_meetings) != len(meetings):
+            logger.debug("Filtered out potential Calendly meetings",
+                        removed_count=len(meetings) - len(filtered_meetings))
 
         return filtered_meetings
 
     def _is_calendly_meeting(self, meeting: Dict[str, Any]) -> bool:
         """Determine if a meeting is likely from Calendly or other automated booking systems."""
-        props = meeting.get("properties", {})
+        props = meeting.get("properties") or {}
 
-        # Check external URL for Calendly indicators
+        # Check external URL for Calendly indicators (the most reliable signal)
         # FIXED: Use (value or "") pattern to handle None values
-        external_url = (props.get("hs_meeting_external_url") or "").lower()
-        if "calendly.com" in external_url:
+        if _CALENDLY_URL_RE.search(props.get("hs_meeting_external_url") or ""):
             return True
 
         # Check meeting title for Calendly patterns
-        title = (props.get("hs_meeting_title") or "").lower()
-        calendly_patterns = [
-            "calendly",
-            "quick call",
-            "discovery call",
-            "15 minute",
-            "30 minute",
-            "book a time",
-            "schedule a call"
-        ]
-
-        if any(pattern in title for pattern in calendly_patterns):
+        if _CALENDLY_TITLE_RE.search(props.get("hs_meeting_title") or ""):
             return True
 
         # Check location for virtual meeting indicators that might be automated
-        location = (props.get("hs_meeting_location") or "").lower()
-        if location and any(indicator in location for indicator in ["calendly", "automated", "zoom.us/j/"]):
-            return True
-
-        return False
+        return bool(_CALENDLY_LOCATION_RE.search(props.get("hs_meeting_location") or ""))
 
-    def _sort_meetings_by_start_time(self, meetings: List[Dict[str, Any]], sort_direction: str) -> List[Dict[str, Any]]:
-        """Sort meetings by start time, handling null values properly."""
-        def get_start_time(meeting: Dict[str, Any]) -> int:
-            """Extract start time as milliseconds, defaulting to 0 for null values."""
-            props = meeting.get("properties", {})
-            start_time = props.get("hs_meeting_start_time")
-            if start_time:
-                try:
-                    return int(start_time)
-                except (ValueError, TypeError):
-                    pass
-            return 0
-
-        # Sort with reverse=True for DESCENDING (most recent first)
-        sorted_meetings = sorted(meetings, key=get_start_time, reverse=(sort_direction == "DESCENDING"))
+    def _sort_meetings_by_start_time(
+        self,
+        meetings: List[Dict[str, Any]],
+        sort_direction: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Sort meetings by start time, keeping only the first `limit` when given."""
+        if limit and limit < len(meetings):
+            # Selecting the top K is O(N log K) rather than a full sort
+            select = heapq.nlargest if sort_direction == "DESCENDING" else heapq.nsmallest
+            sorted_meetings = select(limit, meetings, key=_meeting_start_time)
+        else:
+            # Sort with reverse=True for DESCENDING (most recent first)
+            sorted_meetings = sorted(meetings, key=_meeting_start_time, reverse=(sort_direction == "DESCENDING"))
 
         # Log first and last meeting for debugging
-        if sorted_meetings:
+        if sorted_meetings and _std_logger.isEnabledFor(logging.DEBUG):
             first_meeting = sorted_meetings[0]
             last_meeting = sorted_meetings[-1]
             logger.debug("Sorted meetings",
@@ -1157,58 +1714,29 @@ class HubSpotClient:
         if not meeting_ids:
             return []
 
-        meetings = []
-        batch_size = 100  # HubSpot limit for batch read
-
-        # Process meetings in batches of 100
-        for i in range(0, len(meeting_ids), batch_size):
-            batch_ids = meeting_ids[i:i + batch_size]
-
-            # Build batch request
-            batch_data = {
-                "inputs": [{"id": meeting_id} for meeting_id in batch_ids],
-                "properties": [
-                    "hs_meeting_title",
-                    "hs_meeting_body",
-                    "hs_meeting_start_time",
-                    "hs_meeting_end_time",
-                    "hs_meeting_outcome",
-                    "hs_meeting_location",
-                    "hs_meeting_external_url",
-                    "hs_activity_type",
-                    "hs_timestamp",
-                    "hs_createdate",
-                    "hs_lastmodifieddate",
-                    "hubspot_owner_id"
-                ]
-            }
+        properties = list(_MEETING_PROPERTIES)
 
+        async def fetch_meeting(meeting_id: str) -> Optional[Dict[str, Any]]:
             try:
-                endpoint = "/crm/v3/objects/meetings/batch/read"
-                batch_result = await self._make_request("POST", endpoint, data=batch_data)
-
-                if "results" in batch_result:
-                    meetings.extend(batch_result["results"])
-
-                # Log any errors from the batch
-                if "errors" in batch_result:
-                    for error in batch_result["errors"]:
-                        logger.warning("Batch read error for meeting",
-                                     meeting_id=error.get("id"),
-                                     error=error.get("message"))
+                return await self.get_meeting_details(meeting_id)
+            except HubSpotError:
+                # Skip meetings we can't access
+                return None
 
+        async def read_batch(batch_ids: List[str]) -> List[Dict[str, Any]]:
+            try:
+                return await self._batch_read("meetings", batch_ids, properties)
             except HubSpotError as e:
                 logger.warning("Batch API failed, falling back to individual requests",
                              batch_size=len(batch_ids), error=str(e))
 
-                # Fallback to individual meeting requests for this batch
-                for meeting_id in batch_ids:
-                    try:
-                        meeting_details = await self.get_meeting_details(meeting_id)
-                        meetings.append(meeting_details)
-                    except HubSpotError:
-                        # Skip meetings we can't access
-                        continue
+            # Fallback to individual meeting requests for this batch
+            batch_meetings = await asyncio.gather(*(fetch_meeting(meeting_id) for meeting_id in batch_ids))
+            return [meeting for meeting in batch_meetings if meeting is not None]
+
+        # Process meetings in concurrent batches of 100
+        batches = await asyncio.gather(*(read_batch(batch_ids) for batch_ids in _chunked(meeting_ids, _BATCH_READ_LIMIT)))
+        meetings = [meeting for batch in batches for meeting in batch]
 
         logger.info("Retrieved meetings via batch API",
                    requested_count=len(meeting_ids),
@@ -1253,16 +1781,7 @@ class HubSpotClient:
                     ]
                 }
             ],
-            "properties": [
-                "hs_meeting_title",
-                "hs_meeting_body",
-                "hs_meeting_start_time",
-                "hs_meeting_end_time",
-                "hs_meeting_outcome",
-                "hs_meeting_location",
-                "hs_timestamp",
-                "hubspot_owner_id"
-            ],
+            "properties": list(_MEETING_SEARCH_PROPERTIES),
             "sorts": [
                 {
                     "propertyName": "hs_meeting_start_time",
@@ -1281,7 +1800,8 @@ class HubSpotClient:
     async def search_deals_by_name(
         self,
         deal_name: str,
-        limit: int = 10
+        limit: int = 10,
+        first_only: bool = False
     ) -> Dict[str, Any]:
         """
         Search for deals by name using fuzzy matching.
@@ -1289,12 +1809,19 @@ class HubSpotClient:
         Args:
             deal_name: The deal name to search for
             limit: Number of results to return (default: 10)
+            first_only: Only fetch the most recently modified match, overriding limit
 
         Returns:
             Collection of matching deals sorted by most recently modified
         """
+        if first_only:
+            limit = 1
+
         logger.info("Searching deals by name", deal_name=deal_name, limit=limit)
 
+        # HubSpot's search is case-insensitive, so normalize before caching
+        deal_name = _normalize_search_name(deal_name)
+
         search_data = {
             "filterGroups": [
                 {
@@ -1307,22 +1834,8 @@ class HubSpotClient:
                     ]
                 }
             ],
-            "properties": [
-                "dealname",
-                "dealstage",
-                "amount",
-                "closedate",
-                "pipeline",
-                "hs_lastmodifieddate",
-                "hs_createdate",
-                "hubspot_owner_id"
-            ],
-            "sorts": [
-                {
-                    "propertyName": "hs_lastmodifieddate",
-                    "direction": "DESCENDING"
-                }
-            ],
+            "properties": list(_DEAL_SEARCH_PROPERTIES),
+            "sorts": _SORT_LASTMODIFIED_DESC,
             "limit": limit
         }
 
@@ -1336,7 +1849,8 @@ class HubSpotClient:
         self,
         contact_name: Optional[str] = None,
         contact_email: Optional[str] = None,
-        limit: int = 10
+        limit: int = 10,
+        first_only: bool = False
     ) -> Dict[str, Any]:
         """
         Search for contacts by name or email.
@@ -1345,10 +1859,14 @@ class HubSpotClient:
             contact_name: Contact name to search for (searches firstname and lastname)
             contact_email: Contact email to search for (exact match)
             limit: Number of results to return (default: 10)
+            first_only: Only fetch the most recently modified match, overriding limit
 
         Returns:
             Collection of matching contacts sorted by most recently modified
         """
+        if first_only:
+            limit = 1
+
         logger.info("Searching contacts", contact_name=contact_name, contact_email=contact_email, limit=limit)
 
         filters = []
@@ -1362,24 +1880,11 @@ class HubSpotClient:
             })
         elif contact_name:
             # Use query parameter for name search across multiple fields
+            contact_name = _normalize_search_name(contact_name)
             search_data = {
                 "query": contact_name,
-                "properties": [
-                    "firstname",
-                    "lastname",
-                    "email",
-                    "phone",
-                    "company",
-                    "hs_lastmodifieddate",
-                    "hs_createdate",
-                    "hubspot_owner_id"
-                ],
-                "sorts": [
-                    {
-                        "propertyName": "hs_lastmodifieddate",
-                        "direction": "DESCENDING"
-                    }
-                ],
+                "properties": list(_CONTACT_SEARCH_PROPERTIES),
+                "sorts": _SORT_LASTMODIFIED_DESC,
                 "limit": limit
             }
 
@@ -1392,22 +1897,8 @@ class HubSpotClient:
         # Email search path
         search_data = {
             "filterGroups": [{"filters": filters}],
-            "properties": [
-                "firstname",
-                "lastname",
-                "email",
-                "phone",
-                "company",
-                "hs_lastmodifieddate",
-                "hs_createdate",
-                "hubspot_owner_id"
-            ],
-            "sorts": [
-                {
-                    "propertyName": "hs_lastmodifieddate",
-                    "direction": "DESCENDING"
-                }
-            ],
+            "properties": list(_CONTACT_SEARCH_PROPERTIES),
+            "sorts": _SORT_LASTMODIFIED_DESC,
             "limit": limit
         }
 
@@ -1417,6 +1908,55 @@ class HubSpotClient:
         logger.info("Found contacts by email", contact_email=contact_email, count=len(result.get("results", [])))
         return result
 
+    async def _get_deal_info(self, deal_id: str) -> Dict[str, Any]:
+        """Get deal info for context, falling back to the bare ID on failure."""
+        try:
+            endpoint = f"/crm/v3/objects/deals/{deal_id}"
+            params = {"properties": _DEAL_INFO_PROPERTIES}
+            return await self._make_request("GET", endpoint, params=params)
+        except HubSpotError as e:
+            logger.warning("Failed to get deal info", deal_id=deal_id, error=str(e))
+            return {"id": deal_id}
+
+    async def _get_contact_info(self, contact_id: str) -> Dict[str, Any]:
+        """Get contact info for context, falling back to the bare ID on failure."""
+        try:
+            endpoint = f"/crm/v3/objects/contacts/{contact_id}"
+            params = {"properties": _CONTACT_INFO_PROPERTIES}
+            return await self._make_request("GET", endpoint, params=params)
+        except HubSpotError as e:
+            logger.warning("Failed to get contact info", contact_id=contact_id, error=str(e))
+            return {"id": contact_id}
+
+    async def _search_associated_tasks(
+        self,
+        object_type: str,
+        object_id: str,
+        include_completed: bool,
+        limit: int
+    ) -> Dict[str, Any]:
+        """Search tasks associated with a deal or contact, oldest due first."""
+        filters = [
+            {
+                "propertyName": f"associations.{object_type}",
+                "operator": "EQ",
+                "value": object_id
+            }
+        ]
+
+        # Filter out completed tasks unless requested
+        if not include_completed:
+            filters.append({
+                "propertyName": "hs_task_status",
+                "operator": "NEQ",
+                "value": "COMPLETED"
+            })
+
+        search_data = {**_TASK_SEARCH_TEMPLATE, "filterGroups": [{"filters": filters}], "limit": min(limit, 100)}
+
+        endpoint = "/crm/v3/objects/tasks/search"
+        return await self._make_request("POST", endpoint, data=search_data)
+
     async def get_tasks_for_deal(
         self,
         deal_id: Optional[str] = None,
@@ -1439,8 +1979,9 @@ class HubSpotClient:
         logger.info("Getting tasks for deal", deal_id=deal_id, deal_name=deal_name, include_completed=include_completed)
 
         # If deal_name provided, search for the deal first
+        deal_info = None
         if not deal_id and deal_name:
-            deals_result = await self.search_deals_by_name(deal_name, limit=5)
+            deals_result = await self.search_deals_by_name(deal_name, first_only=True)
             deals = deals_result.get("results", [])
 
             if not deals:
@@ -1456,78 +1997,26 @@ class HubSpotClient:
             deal_id = deals[0]["id"]
             deal_info = deals[0]
             logger.info("Found matching deal", deal_id=deal_id, deal_name=deal_info.get("properties", {}).get("dealname"))
-        elif deal_id:
-            # Get deal info for context
-            try:
-                endpoint = f"/crm/v3/objects/deals/{deal_id}"
-                params = {"properties": "dealname,dealstage,amount,closedate,pipeline,hs_lastmodifieddate"}
-                deal_info = await self._make_request("GET", endpoint, params=params)
-            except HubSpotError as e:
-                logger.warning("Failed to get deal info", deal_id=deal_id, error=str(e))
-                deal_info = {"id": deal_id}
-        else:
+        elif not deal_id:
             raise HubSpotError("Either deal_id or deal_name must be provided", "VALIDATION_ERROR")
 
-        # Build task search filters
-        filters = [
-            {
-                "propertyName": "associations.deal",
-                "operator": "EQ",
-                "value": deal_id
-            }
-        ]
-
-        # Filter out completed tasks unless requested
-        if not include_completed:
-            filters.append({
-                "propertyName": "hs_task_status",
-                "operator": "NEQ",
-                "value": "COMPLETED"
-            })
-
-        search_data = {
-            "filterGroups": [{"filters": filters}],
-            "properties": [
-                "hs_task_subject",
-                "hs_task_body",
-                "hs_task_status",
-                "hs_task_priority",
-                "hubspot_owner_id",
-                "hs_task_type",
-                "hs_timestamp",
-                "hs_createdate",
-                "hs_task_due_date"
-            ],
-            "sorts": [
-                {
-                    "propertyName": "hs_timestamp",
-                    "direction": "ASCENDING"
-                }
-            ],
-            "limit": min(limit, 100)
-        }
-
-        endpoint = "/crm/v3/objects/tasks/search"
-        result = await self._make_request("POST", endpoint, data=search_data)
+        search = self._search_associated_tasks("deal", deal_id, include_completed, limit)
+        if deal_info is None:
+            # Fetch deal info for context while the task search runs, and
+            # cancel the lookup if the search fails
+            info = asyncio.ensure_future(self._get_deal_info(deal_id))
+            try:
+                result = await search
+            except BaseException:
+                info.cancel()
+                raise
+            deal_info = await info
+        else:
+            result = await search
 
         # Add overdue status to tasks
         if "results" in result:
-            current_time = datetime.now().timestamp() * 1000
-            for task in result["results"]:
-                task_props = task.get("properties", {})
-                due_date = task_props.get("hs_task_due_date") or task_props.get("hs_timestamp")
-                task["is_overdue"] = False
-                task["overdue_days"] = 0
-
-                if due_date and task_props.get("hs_task_status") not in ["COMPLETED", "DEFERRED"]:
-                    try:
-                        due_date_ms = int(due_date)
-                        if current_time > due_date_ms:
-                            task["is_overdue"] = True
-                            overdue_ms = current_time - due_date_ms
-                            task["overdue_days"] = int(overdue_ms / (24 * 60 * 60 * 1000))
-                    except (ValueError, TypeError):
-                        pass
+            _annotate_overdue(result["results"], int(time.time() * 1000))
 
         result["deal_info"] = deal_info
         result["total"] = len(result.get("results", []))
@@ -1560,8 +2049,9 @@ class HubSpotClient:
                    contact_email=contact_email, include_completed=include_completed)
 
         # If contact_name or contact_email provided, search for the contact first
+        contact_info = None
         if not contact_id and (contact_name or contact_email):
-            contacts_result = await self.search_contacts(contact_name=contact_name, contact_email=contact_email, limit=5)
+            contacts_result = await self.search_contacts(contact_name=contact_name, contact_email=contact_email, first_only=True)
             contacts = contacts_result.get("results", [])
 
             if not contacts:
@@ -1579,78 +2069,26 @@ class HubSpotClient:
             contact_info = contacts[0]
             logger.info("Found matching contact", contact_id=contact_id,
                        email=contact_info.get("properties", {}).get("email"))
-        elif contact_id:
-            # Get contact info for context
-            try:
-                endpoint = f"/crm/v3/objects/contacts/{contact_id}"
-                params = {"properties": "firstname,lastname,email,phone,company,hs_lastmodifieddate"}
-                contact_info = await self._make_request("GET", endpoint, params=params)
-            except HubSpotError as e:
-                logger.warning("Failed to get contact info", contact_id=contact_id, error=str(e))
-                contact_info = {"id": contact_id}
-        else:
+        elif not contact_id:
             raise HubSpotError("Either contact_id, contact_name, or contact_email must be provided", "VALIDATION_ERROR")
 
-        # Build task search filters
-        filters = [
-            {
-                "propertyName": "associations.contact",
-                "operator": "EQ",
-                "value": contact_id
-            }
-        ]
-
-        # Filter out completed tasks unless requested
-        if not include_completed:
-            filters.append({
-                "propertyName": "hs_task_status",
-                "operator": "NEQ",
-                "value": "COMPLETED"
-            })
-
-        search_data = {
-            "filterGroups": [{"filters": filters}],
-            "properties": [
-                "hs_task_subject",
-                "hs_task_body",
-                "hs_task_status",
-                "hs_task_priority",
-                "hubspot_owner_id",
-                "hs_task_type",
-                "hs_timestamp",
-                "hs_createdate",
-                "hs_task_due_date"
-            ],
-            "sorts": [
-                {
-                    "propertyName": "hs_timestamp",
-                    "direction": "ASCENDING"
-                }
-            ],
-            "limit": min(limit, 100)
-        }
-
-        endpoint = "/crm/v3/objects/tasks/search"
-        result = await self._make_request("POST", endpoint, data=search_data)
+        search = self._search_associated_tasks("contact", contact_id, include_completed, limit)
+        if contact_info is None:
+            # Fetch contact info for context while the task search runs, and
+            # cancel the lookup if the search fails
+            info = asyncio.ensure_future(self._get_contact_info(contact_id))
+            try:
+                result = await search
+            except BaseException:
+                info.cancel()
+                raise
+            contact_info = await info
+        else:
+            result = await search
 
         # Add overdue status to tasks
         if "results" in result:
-            current_time = datetime.now().timestamp() * 1000
-            for task in result["results"]:
-                task_props = task.get("properties", {})
-                due_date = task_props.get("hs_task_due_date") or task_props.get("hs_timestamp")
-                task["is_overdue"] = False
-                task["overdue_days"] = 0
-
-                if due_date and task_props.get("hs_task_status") not in ["COMPLETED", "DEFERRED"]:
-                    try:
-                        due_date_ms = int(due_date)
-                        if current_time > due_date_ms:
-                            task["is_overdue"] = True
-                            overdue_ms = current_time - due_date_ms
-                            task["overdue_days"] = int(overdue_ms / (24 * 60 * 60 * 1000))
-                    except (ValueError, TypeError):
-                        pass
+            _annotate_overdue(result["results"], int(time.time() * 1000))
 
         result["contact_info"] = contact_info
         result["total"] = len(result.get("results", []))
@@ -1693,76 +2131,60 @@ class HubSpotClient:
         Returns:
             Created meeting object with ID and all properties
         """
-        logger.info("Creating meeting", title=title, start_time=start_time)
+        # Checked at call time: logging is configured after this module is imported
+        log_info = _std_logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Creating meeting", title=title, start_time=start_time)
 
-        # Convert ISO date to timestamp (milliseconds)
+        # Convert ISO dates to timestamps (milliseconds) up front, so a bad
+        # end_time fails before any payload is built
         timestamp_ms = self._convert_iso_to_timestamp(start_time)
-
-        # Build meeting properties
+        end_timestamp_ms = self._convert_iso_to_timestamp(end_time) if end_time else None
+
+        # Build meeting properties, keeping only the optional fields that were provided
+        start_ms = str(timestamp_ms)
+        optional_properties = (
+            ("hs_meeting_end_time", str(end_timestamp_ms) if end_timestamp_ms is not None else None),
+            ("hs_meeting_body", description),
+            ("hubspot_owner_id", owner_id),
+            ("hs_meeting_outcome", outcome),
+            ("hs_meeting_location", location),
+            ("hs_activity_type", meeting_type),
+            ("hs_internal_meeting_notes", internal_notes)
+        )
         properties = {
-            "hs_timestamp": str(timestamp_ms),
-            "hs_meeting_start_time": str(timestamp_ms),
+            "hs_timestamp": start_ms,
+            "hs_meeting_start_time": start_ms,
             "hs_meeting_title": title,
+            **{name: value for name, value in optional_properties if value}
         }
 
-        if end_time:
-            end_timestamp_ms = self._convert_iso_to_timestamp(end_time)
-            properties["hs_meeting_end_time"] = str(end_timestamp_ms)
-
-        if description:
-            properties["hs_meeting_body"] = description
-
-        if owner_id:
-            properties["hubspot_owner_id"] = owner_id
-
-        if outcome:
-            properties["hs_meeting_outcome"] = outcome
-
-        if location:
-            properties["hs_meeting_location"] = location
-
-        if meeting_type:
-            properties["hs_activity_type"] = meeting_type
-
-        if internal_notes:
-            properties["hs_internal_meeting_notes"] = internal_notes
-
-        # Build associations
-        associations = []
-
-        # Associate with contacts
-        if contact_ids:
-            for contact_id in contact_ids:
-                associations.append({
-                    "to": {"id": contact_id},
-                    "types": [{
-                        "associationCategory": "HUBSPOT_DEFINED",
-                        "associationTypeId": 200  # Meeting to contact association
-                    }]
-                })
-
-        # Associate with deals
-        if deal_ids:
-            for deal_id in deal_ids:
-                associations.append({
-                    "to": {"id": deal_id},
-                    "types": [{
-                        "associationCategory": "HUBSPOT_DEFINED",
-                        "associationTypeId": 212  # Meeting to deal association
-                    }]
-                })
-
-        data = {
-            "properties": properties,
-            "associations": associations
-        }
+        data: Dict[str, Any] = {"properties": properties}
+
+        # Build associations to contacts and deals, omitting the key when there are none
+        contact_ids = tuple(contact_ids) if contact_ids else ()
+        deal_ids = tuple(deal_ids) if deal_ids else ()
+        if contact_ids or deal_ids:
+            data["associations"] = [
+                {"to": {"id": contact_id}, "types": _MEETING_TO_CONTACT_TYPES}
+                for contact_id in contact_ids
+            ] + [
+                {"to": {"id": deal_id}, "types": _MEETING_TO_DEAL_TYPES}
+                for deal_id in deal_ids
+            ]
 
         endpoint = "/crm/v3/objects/meetings"
         result = await self._make_request("POST", endpoint, data=data)
+        self._invalidate("meeting")
 
-        logger.info("Created meeting", meeting_id=result.get("id"), title=title)
+        if log_info:
+            logger.info("Created meeting", meeting_id=result.get("id"), title=title)
         return result
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its keep-alive connections."""
+        await self.client.aclose()
+
     async def close(self):
         """Close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        await self.aclose()
\ No newline at end of file
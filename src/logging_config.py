@@ -2,14 +2,31 @@
 Logging configuration for HubSpot Extended MCP Server
 """
 
+import functools
 import logging
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 
 
-def configure_logging(log_level: str = "INFO") -> None:
+def _orjson_dumps(event_dict: Dict[str, Any], **kwargs: Any) -> str:
+    """Serialize log events with orjson, returning str for the stdlib handler."""
+    # Non-string keys are stringified as the stdlib json module did, instead of raising
+    return orjson.dumps(event_dict, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _select_renderer(log_format: Optional[str]) -> Any:
+    """Pick the final log renderer: logfmt or console on request, console on a TTY, JSON otherwise."""
+    if log_format == "logfmt":
+        return structlog.processors.KeyValueRenderer(key_order=["event"])
+    if log_format == "console" or (log_format is None and sys.stderr.isatty()):
+        return structlog.dev.ConsoleRenderer(colors=False)
+    return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
+
+def configure_logging(log_level: str = "INFO", log_format: Optional[str] = None) -> None:
     """Configure structured logging for the application."""
 
     # Configure standard library logging - use stderr to avoid interfering with MCP stdio
@@ -25,11 +42,8 @@ def configure_logging(log_level: str = "INFO") -> None:
             structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            _select_renderer(log_format.lower() if log_format else None)
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -38,6 +52,7 @@ def configure_logging(log_level: str = "INFO") -> None:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
-    """Get a configured logger instance."""
+    """Get a configured logger instance, shared per name."""
     return structlog.get_logger(name)
\ No newline at end of file
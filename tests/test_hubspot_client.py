@@ -0,0 +1,159 @@
+"""
+Behavioural tests for request coalescing, batching, cache invalidation and the server lifespan
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from src import fastmcp_server
+from src.hubspot_client import HubSpotClient
+
+TASK_SEARCH = "/crm/v3/objects/tasks/search"
+SEARCH_DATA = {"filterGroups": [], "limit": 10}
+
+
+@pytest.fixture(autouse=True)
+def access_token(monkeypatch):
+    monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "test-token")
+
+
+def _client_with(handler) -> HubSpotClient:
+    """Build a HubSpotClient whose HTTP client is served by a mock transport."""
+    client = HubSpotClient()
+    client.client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client.headers,
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _search_response(names):
+    return httpx.Response(200, content=orjson.dumps({"results": [{"id": name} for name in names]}))
+
+
+def test_concurrent_identical_reads_share_one_send():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return _search_response(["a"])
+
+    async def main():
+        client = _client_with(handler)
+        results = await asyncio.gather(*(
+            client._make_request("POST", TASK_SEARCH, data=SEARCH_DATA) for _ in range(3)
+        ))
+        await client.aclose()
+        return results
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert results == [{"results": [{"id": "a"}]}] * 3
+
+
+def test_cancelled_first_caller_does_not_fail_others():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return _search_response(["a"])
+
+    async def main():
+        client = _client_with(handler)
+        leader = asyncio.ensure_future(client._make_request("POST", TASK_SEARCH, data=SEARCH_DATA))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(client._make_request("POST", TASK_SEARCH, data=SEARCH_DATA))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+        await client.aclose()
+        return leader, result
+
+    leader, result = asyncio.run(main())
+    assert leader.cancelled()
+    assert result == {"results": [{"id": "a"}]}
+    assert len(calls) == 1
+
+
+def test_write_during_inflight_read_is_not_cached():
+    state = {"names": ["old"]}
+
+    async def handler(request):
+        # Answer with the data as it was when the request reached the server
+        names = list(state["names"])
+        await asyncio.sleep(0.05)
+        return _search_response(names)
+
+    async def main():
+        client = _client_with(handler)
+        before = asyncio.ensure_future(client._make_request("POST", TASK_SEARCH, data=SEARCH_DATA))
+        await asyncio.sleep(0.01)
+
+        # A task is created while the search is still in flight
+        state["names"].append("new")
+        client._invalidate("task")
+
+        during = asyncio.ensure_future(client._make_request("POST", TASK_SEARCH, data=SEARCH_DATA))
+        results = [await before, await during]
+        results.append(await client._make_request("POST", TASK_SEARCH, data=SEARCH_DATA))
+        await client.aclose()
+        return results
+
+    before, during, after = asyncio.run(main())
+    assert before == {"results": [{"id": "old"}]}
+    assert during == {"results": [{"id": "old"}, {"id": "new"}]}
+    assert after == {"results": [{"id": "old"}, {"id": "new"}]}
+
+
+def test_batch_fetcher_merges_concurrent_gets():
+    inputs = []
+
+    async def handler(request):
+        ids = [item["id"] for item in orjson.loads(request.content)["inputs"]]
+        inputs.append(ids)
+        return httpx.Response(200, content=orjson.dumps({"results": [{"id": object_id} for object_id in ids if object_id != "3"]}))
+
+    async def main():
+        client = _client_with(handler)
+        deals = await asyncio.gather(*(client._deal_fetcher.get(deal_id) for deal_id in ("1", "2", "1", "3")))
+        await client.aclose()
+        return deals
+
+    deals = asyncio.run(main())
+    assert inputs == [["1", "2", "3"]]
+    assert deals == [{"id": "1"}, {"id": "2"}, {"id": "1"}, None]
+
+
+def test_lifespan_closes_and_resets_client_after_last_session():
+    fastmcp_server._client.cache_clear()
+
+    async def main():
+        first_session = fastmcp_server.lifespan(fastmcp_server.mcp)
+        second_session = fastmcp_server.lifespan(fastmcp_server.mcp)
+        await first_session.__aenter__()
+        await second_session.__aenter__()
+        client = fastmcp_server._client()
+
+        # Another session is still open, so the shared client stays usable
+        await first_session.__aexit__(None, None, None)
+        assert not client.client.is_closed
+        assert fastmcp_server._client() is client
+
+        await second_session.__aexit__(None, None, None)
+        assert client.client.is_closed
+        assert fastmcp_server._client.cache_info().currsize == 0
+
+        replacement = fastmcp_server._client()
+        assert replacement is not client
+        await replacement.aclose()
+
+    try:
+        asyncio.run(main())
+    finally:
+        fastmcp_server._client.cache_clear()